@@ -3,7 +3,7 @@ from __future__ import annotations
 import dataclasses
 import logging
 import time
-from operator import attrgetter
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Type, TypeVar
 
 from blspy import G1Element, G2Element
@@ -22,16 +22,18 @@ from lotus.types.coin_spend import CoinSpend
 from lotus.types.condition_opcodes import ConditionOpcode
 from lotus.types.spend_bundle import SpendBundle
 from lotus.util.ints import uint8, uint32, uint64, uint128
+from lotus.util.lru_cache import LRUCache
 from lotus.util.streamable import Streamable, streamable
 from lotus.wallet.db_wallet.db_wallet_puzzles import (
     ACS_MU,
     ACS_MU_PH,
     GRAFTROOT_DL_OFFERS,
-    SINGLETON_LAUNCHER,
+    MIRROR_PUZZLE_HASH,
+    MIRROR_PUZZLE_SERIALIZED,
+    SINGLETON_LAUNCHER_SERIALIZED,
     create_graftroot_offer_puz,
     create_host_fullpuz,
     create_host_layer_puzzle,
-    create_mirror_puzzle,
     get_mirror_info,
     launch_solution_to_singleton_info,
     launcher_to_struct,
@@ -41,11 +43,12 @@ from lotus.wallet.derivation_record import DerivationRecord
 from lotus.wallet.lineage_proof import LineageProof
 from lotus.wallet.outer_puzzles import AssetType
 from lotus.wallet.puzzle_drivers import PuzzleInfo, Solver
+from lotus.wallet.puzzles.p2_delegated_puzzle_or_hidden_puzzle import puzzle_for_pk
 from lotus.wallet.puzzles.singleton_top_layer_v1_1 import SINGLETON_LAUNCHER_HASH
 from lotus.wallet.sign_coin_spends import sign_coin_spends
 from lotus.wallet.trading.offer import NotarizedPayment, Offer
 from lotus.wallet.transaction_record import TransactionRecord
-from lotus.wallet.util.compute_memos import compute_memos
+from lotus.wallet.util.compute_memos import compute_additions_and_memos
 from lotus.wallet.util.merkle_utils import _simplify_merkle_proof
 from lotus.wallet.util.transaction_type import TransactionType
 from lotus.wallet.util.wallet_types import AmountWithPuzzlehash, WalletType
@@ -57,6 +60,58 @@ if TYPE_CHECKING:
     from lotus.wallet.wallet_state_manager import WalletStateManager
 
 
+# PuzzleInfo values are CLVM formatted strings, so format the constant ones once
+_SINGLETON_LAUNCHER_HASH_INFO = "0x" + SINGLETON_LAUNCHER_HASH.hex()
+_ACS_MU_PH_INFO = "0x" + ACS_MU_PH.hex()
+
+
+@lru_cache(maxsize=4096)
+def _host_fullpuz_hash(inner_puzzle_hash: bytes32, root: bytes32, launcher_id: bytes32) -> bytes32:
+    return create_host_fullpuz(inner_puzzle_hash, root, launcher_id).get_tree_hash_precalc(inner_puzzle_hash)
+
+
+@lru_cache(maxsize=4096)
+def _host_layer_puzzle_hash(inner_puzzle_hash: bytes32, root: bytes32) -> bytes32:
+    return create_host_layer_puzzle(inner_puzzle_hash, root).get_tree_hash_precalc(inner_puzzle_hash)
+
+
+# G1Element is not hashable, so key on its serialization and build misses from the element without re-parsing it
+_STANDARD_PUZZLE_CACHE: LRUCache = LRUCache(2048)
+
+
+def _standard_puzzle_for_pk(pubkey: G1Element) -> Program:
+    key: bytes = bytes(pubkey)
+    puzzle: Optional[Program] = _STANDARD_PUZZLE_CACHE.get(key)
+    if puzzle is None:
+        puzzle = puzzle_for_pk(pubkey)
+        _STANDARD_PUZZLE_CACHE.put(key, puzzle)
+    return puzzle
+
+
+@lru_cache(maxsize=1024)
+def _launcher_struct_hash(launcher_id: bytes32) -> bytes32:
+    return launcher_to_struct(launcher_id).get_tree_hash()
+
+
+# Keyed by the serialized puzzle reveal which can be a couple of KB, so keep the cache smaller than the hash caches
+@lru_cache(maxsize=1024)
+def _match_dl_singleton(puzzle_reveal: bytes) -> Tuple[bool, Tuple[Program, ...]]:
+    matched, curried_args = match_dl_singleton(Program.from_bytes(puzzle_reveal))
+    return matched, tuple(curried_args)
+
+
+def _find_odd_create_coin(conditions: List[List[Any]]) -> Optional[Tuple[bytes32, uint64, List[bytes]]]:
+    """
+    Returns the puzzle hash, amount and memos of the first CREATE_COIN with an odd amount (the singleton child)
+    """
+    for condition in conditions:
+        if condition[0] == ConditionOpcode.CREATE_COIN:
+            amount = int.from_bytes(condition[2], "big")
+            if amount & 1:
+                return bytes32(condition[1]), uint64(amount), condition[3] if len(condition) > 3 else []
+    return None
+
+
 @streamable
 @dataclasses.dataclass(frozen=True)
 class SingletonRecord(Streamable):
@@ -152,9 +207,8 @@ class DataLayerWallet:
         self.log = logging.getLogger(name if name else __name__)
         self.standard_wallet = wallet
 
-        for _, wallet in self.wallet_state_manager.wallets.items():
-            if wallet.type() == uint8(WalletType.DATA_LAYER):
-                raise ValueError("DataLayer Wallet already exists for this key")
+        if wallet_state_manager.get_dl_wallet() is not None:
+            raise ValueError("DataLayer Wallet already exists for this key")
 
         assert name is not None
         self.wallet_info = await wallet_state_manager.user_store.create_wallet(
@@ -165,9 +219,7 @@ class DataLayerWallet:
         self.wallet_id = uint8(self.wallet_info.id)
 
         await self.wallet_state_manager.add_new_wallet(self, self.wallet_info.id)
-        await self.wallet_state_manager.interested_store.add_interested_puzzle_hash(
-            create_mirror_puzzle().get_tree_hash(), self.id()
-        )
+        await self.wallet_state_manager.interested_store.add_interested_puzzle_hash(MIRROR_PUZZLE_HASH, self.id())
 
         return self
 
@@ -178,7 +230,7 @@ class DataLayerWallet:
     @staticmethod
     async def match_dl_launcher(launcher_spend: CoinSpend) -> Tuple[bool, Optional[bytes32]]:
         # Sanity check it's a launcher
-        if launcher_spend.puzzle_reveal.to_program() != SINGLETON_LAUNCHER:
+        if launcher_spend.puzzle_reveal != SINGLETON_LAUNCHER_SERIALIZED:
             return False, None
 
         # Let's make sure the solution looks how we expect it to
@@ -190,11 +242,7 @@ class DataLayerWallet:
             return False, None
 
         # Now let's check that the full puzzle is an odd data layer singleton
-        if (
-            full_puzhash
-            != create_host_fullpuz(inner_puzhash, root, launcher_spend.coin.name()).get_tree_hash_precalc(inner_puzhash)
-            or amount % 2 == 0
-        ):
+        if full_puzhash != _host_fullpuz_hash(inner_puzhash, root, launcher_spend.coin.name()) or amount % 2 == 0:
             return False, None
 
         return True, inner_puzhash
@@ -206,7 +254,7 @@ class DataLayerWallet:
 
         if len(coin_states) == 0:
             raise ValueError(f"Launcher ID {launcher_id} is not a valid coin")
-        if coin_states[0].coin.puzzle_hash != SINGLETON_LAUNCHER.get_tree_hash():
+        if coin_states[0].coin.puzzle_hash != SINGLETON_LAUNCHER_HASH:
             raise ValueError(f"Coin with ID {launcher_id} is not a singleton launcher")
         if coin_states[0].created_height is None:
             raise ValueError(f"Launcher with ID {launcher_id} has not been created (maybe reorged)")
@@ -249,25 +297,25 @@ class DataLayerWallet:
         full_puzhash, amount, root, inner_puzhash = launch_solution_to_singleton_info(
             launcher_spend.solution.to_program()
         )
-        new_singleton = Coin(launcher_id, full_puzhash, amount)
+        new_singleton_id: bytes32 = Coin(launcher_id, full_puzhash, amount).name()
 
         singleton_record: Optional[SingletonRecord] = await self.wallet_state_manager.dl_store.get_latest_singleton(
             launcher_id
         )
+        if singleton_record is not None and (
+            singleton_record.coin_id != new_singleton_id or singleton_record.confirmed
+        ):
+            self.log.info(f"Spend of launcher {launcher_id} has already been processed")
+            return None
+
+        timestamp = await self.wallet_state_manager.wallet_node.get_timestamp_for_height(height)
         if singleton_record is not None:
-            if (  # This is an unconfirmed singleton that we know about
-                singleton_record.coin_id == new_singleton.name() and not singleton_record.confirmed
-            ):
-                timestamp = await self.wallet_state_manager.wallet_node.get_timestamp_for_height(height)
-                await self.wallet_state_manager.dl_store.set_confirmed(singleton_record.coin_id, height, timestamp)
-            else:
-                self.log.info(f"Spend of launcher {launcher_id} has already been processed")
-                return None
+            # This is an unconfirmed singleton that we know about
+            await self.wallet_state_manager.dl_store.set_confirmed(singleton_record.coin_id, height, timestamp)
         else:
-            timestamp = await self.wallet_state_manager.wallet_node.get_timestamp_for_height(height)
             await self.wallet_state_manager.dl_store.add_singleton_record(
                 SingletonRecord(
-                    coin_id=new_singleton.name(),
+                    coin_id=new_singleton_id,
                     launcher_id=launcher_id,
                     root=root,
                     inner_puzzle_hash=inner_puzhash,
@@ -276,7 +324,7 @@ class DataLayerWallet:
                     timestamp=timestamp,
                     lineage_proof=LineageProof(
                         launcher_id,
-                        create_host_layer_puzzle(inner_puzhash, root).get_tree_hash_precalc(inner_puzhash),
+                        _host_layer_puzzle_hash(inner_puzhash, root),
                         amount,
                     ),
                     generation=uint32(0),
@@ -284,8 +332,7 @@ class DataLayerWallet:
             )
 
         await self.wallet_state_manager.dl_store.add_launcher(launcher_spend.coin)
-        await self.wallet_state_manager.add_interested_puzzle_hashes([launcher_id], [self.id()])
-        await self.wallet_state_manager.add_interested_coin_ids([new_singleton.name()])
+        await self.wallet_state_manager.add_interested([launcher_id], [self.id()], [new_singleton_id])
 
     ################
     # TRANSACTIONS #
@@ -304,22 +351,25 @@ class DataLayerWallet:
         if coins is None:
             raise ValueError("Not enough coins to create new data layer singleton")
 
-        launcher_parent: Coin = list(coins)[0]
-        launcher_coin: Coin = Coin(launcher_parent.name(), SINGLETON_LAUNCHER.get_tree_hash(), uint64(1))
+        # Pick the parent deterministically rather than relying on set iteration order
+        launcher_parent: Coin = min(coins, key=Coin.name)
+        origin_id: bytes32 = launcher_parent.name()
+        launcher_coin: Coin = Coin(origin_id, SINGLETON_LAUNCHER_HASH, uint64(1))
+        launcher_id: bytes32 = launcher_coin.name()
 
         inner_puzzle: Program = await self.standard_wallet.get_new_puzzle()
-        full_puzzle: Program = create_host_fullpuz(inner_puzzle, initial_root, launcher_coin.name())
+        inner_puzzle_hash: bytes32 = inner_puzzle.get_tree_hash()
+        full_puzzle: Program = create_host_fullpuz(inner_puzzle, initial_root, launcher_id)
+        full_puzzle_hash: bytes32 = full_puzzle.get_tree_hash()
 
-        genesis_launcher_solution: Program = Program.to(
-            [full_puzzle.get_tree_hash(), 1, [initial_root, inner_puzzle.get_tree_hash()]]
-        )
+        genesis_launcher_solution: Program = Program.to([full_puzzle_hash, 1, [initial_root, inner_puzzle_hash]])
         announcement_message: bytes32 = genesis_launcher_solution.get_tree_hash()
-        announcement = Announcement(launcher_coin.name(), announcement_message)
+        announcement = Announcement(launcher_id, announcement_message)
         create_launcher_tx_record: Optional[TransactionRecord] = await self.standard_wallet.generate_signed_transaction(
             amount=uint64(1),
-            puzzle_hash=SINGLETON_LAUNCHER.get_tree_hash(),
+            puzzle_hash=SINGLETON_LAUNCHER_HASH,
             fee=fee,
-            origin_id=launcher_parent.name(),
+            origin_id=origin_id,
             coins=coins,
             primaries=None,
             ignore_max_send_amount=False,
@@ -329,14 +379,18 @@ class DataLayerWallet:
 
         launcher_cs: CoinSpend = CoinSpend(
             launcher_coin,
-            SerializedProgram.from_program(SINGLETON_LAUNCHER),
+            SINGLETON_LAUNCHER_SERIALIZED,
             SerializedProgram.from_program(genesis_launcher_solution),
         )
-        launcher_sb: SpendBundle = SpendBundle([launcher_cs], G2Element())
-        full_spend: SpendBundle = SpendBundle.aggregate([create_launcher_tx_record.spend_bundle, launcher_sb])
+        # The launcher spend is unsigned so there is no signature to aggregate
+        full_spend: SpendBundle = dataclasses.replace(
+            create_launcher_tx_record.spend_bundle,
+            coin_spends=[*create_launcher_tx_record.spend_bundle.coin_spends, launcher_cs],
+        )
 
         # Delete from standard transaction so we don't push duplicate spends
         std_record: TransactionRecord = dataclasses.replace(create_launcher_tx_record, spend_bundle=None)
+        full_spend_additions, full_spend_memos = compute_additions_and_memos(full_spend)
         dl_record = TransactionRecord(
             confirmed_at_height=uint32(0),
             created_at_time=uint64(int(time.time())),
@@ -346,9 +400,9 @@ class DataLayerWallet:
             confirmed=False,
             sent=uint32(10),
             spend_bundle=full_spend,
-            additions=full_spend.additions(),
+            additions=full_spend_additions,
             removals=full_spend.removals(),
-            memos=list(compute_memos(full_spend).items()),
+            memos=list(full_spend_memos.items()),
             wallet_id=uint32(0),  # This is being called before the wallet is created so we're using a temp ID of 0
             sent_to=[],
             trade_id=None,
@@ -356,25 +410,25 @@ class DataLayerWallet:
             name=full_spend.name(),
         )
         singleton_record = SingletonRecord(
-            coin_id=Coin(launcher_coin.name(), full_puzzle.get_tree_hash(), uint64(1)).name(),
-            launcher_id=launcher_coin.name(),
+            coin_id=Coin(launcher_id, full_puzzle_hash, uint64(1)).name(),
+            launcher_id=launcher_id,
             root=initial_root,
-            inner_puzzle_hash=inner_puzzle.get_tree_hash(),
+            inner_puzzle_hash=inner_puzzle_hash,
             confirmed=False,
             confirmed_at_height=uint32(0),
             timestamp=uint64(0),
             lineage_proof=LineageProof(
-                launcher_coin.name(),
-                create_host_layer_puzzle(inner_puzzle, initial_root).get_tree_hash(),
+                launcher_id,
+                _host_layer_puzzle_hash(inner_puzzle_hash, initial_root),
                 uint64(1),
             ),
             generation=uint32(0),
         )
 
         await self.wallet_state_manager.dl_store.add_singleton_record(singleton_record)
-        await self.wallet_state_manager.add_interested_puzzle_hashes([singleton_record.launcher_id], [self.id()])
+        await self.wallet_state_manager.add_interested_puzzle_hashes([launcher_id], [self.id()])
 
-        return dl_record, std_record, launcher_coin.name()
+        return dl_record, std_record, launcher_id
 
     async def create_tandem_lch_tx(
         self,
@@ -406,29 +460,107 @@ class DataLayerWallet:
         add_pending_singleton: bool = True,
         announce_new_state: bool = False,
     ) -> List[TransactionRecord]:
-        singleton_record, parent_lineage = await self.get_spendable_singleton_info(launcher_id)
-
-        if root_hash is None:
-            root_hash = singleton_record.root
+        singleton_record: SingletonRecord = await self.get_spendable_singleton_record(launcher_id)
 
+        # These reads stay in this task rather than being gathered: gathered reads run in other tasks, which cannot
+        # see singletons added by an uncommitted transaction we may be in (e.g. when rebasing several singletons)
+        parent_lineage: LineageProof = await self.get_parent_lineage(singleton_record)
         inner_puzzle_derivation: Optional[
             DerivationRecord
         ] = await self.wallet_state_manager.puzzle_store.get_derivation_record_for_puzzle_hash(
             singleton_record.inner_puzzle_hash
         )
+
+        return await self._create_update_state_spend(
+            singleton_record,
+            parent_lineage,
+            inner_puzzle_derivation,
+            root_hash,
+            new_puz_hash,
+            new_amount,
+            fee,
+            coin_announcements_to_consume,
+            puzzle_announcements_to_consume,
+            sign,
+            add_pending_singleton,
+            announce_new_state,
+        )
+
+    async def create_update_state_spends(self, updates: Dict[bytes32, bytes32]) -> List[TransactionRecord]:
+        """
+        Creates an update spend for each launcher ID to root pair in `updates`, fetching the records needed to build
+        the spends for all of the singletons at once rather than one singleton at a time
+        """
+        launcher_ids: List[bytes32] = list(updates.keys())
+        latest_singletons: Dict[
+            bytes32, SingletonRecord
+        ] = await self.wallet_state_manager.dl_store.get_latest_singletons(launcher_ids)
+        singleton_records: List[SingletonRecord] = [
+            self._check_spendable_singleton(launcher_id, latest_singletons.get(launcher_id))
+            for launcher_id in launcher_ids
+        ]
+
+        parent_singletons: Dict[
+            bytes32, SingletonRecord
+        ] = await self.wallet_state_manager.dl_store.get_singleton_records(
+            [
+                record.lineage_proof.parent_name
+                for record in singleton_records
+                if record.lineage_proof.parent_name is not None
+                and record.lineage_proof.parent_name != record.launcher_id
+            ]
+        )
+        inner_puzzle_derivations: Dict[
+            bytes32, DerivationRecord
+        ] = await self.wallet_state_manager.puzzle_store.get_derivation_records_for_puzzle_hashes(
+            [record.inner_puzzle_hash for record in singleton_records]
+        )
+
+        txs: List[TransactionRecord] = []
+        for singleton_record in singleton_records:
+            txs.extend(
+                await self._create_update_state_spend(
+                    singleton_record,
+                    await self.get_parent_lineage(singleton_record, parent_singletons),
+                    inner_puzzle_derivations.get(singleton_record.inner_puzzle_hash),
+                    updates[singleton_record.launcher_id],
+                )
+            )
+
+        return txs
+
+    async def _create_update_state_spend(
+        self,
+        singleton_record: SingletonRecord,
+        parent_lineage: LineageProof,
+        inner_puzzle_derivation: Optional[DerivationRecord],
+        root_hash: Optional[bytes32],
+        new_puz_hash: Optional[bytes32] = None,
+        new_amount: Optional[uint64] = None,
+        fee: uint64 = uint64(0),
+        coin_announcements_to_consume: Optional[Set[Announcement]] = None,
+        puzzle_announcements_to_consume: Optional[Set[Announcement]] = None,
+        sign: bool = True,
+        add_pending_singleton: bool = True,
+        announce_new_state: bool = False,
+    ) -> List[TransactionRecord]:
+        launcher_id: bytes32 = singleton_record.launcher_id
+        if root_hash is None:
+            root_hash = singleton_record.root
+
         if inner_puzzle_derivation is None:
             raise ValueError(f"DL Wallet does not have permission to update Singleton with launcher ID {launcher_id}")
 
         # Make the child's puzzles
         if new_puz_hash is None:
-            new_puz_hash = (await self.standard_wallet.get_new_puzzle()).get_tree_hash()
+            new_puz_hash = await self.standard_wallet.get_new_puzzlehash()
         assert new_puz_hash is not None
-        next_full_puz_hash: bytes32 = create_host_fullpuz(new_puz_hash, root_hash, launcher_id).get_tree_hash_precalc(
-            new_puz_hash
-        )
+        next_full_puz_hash: bytes32 = _host_fullpuz_hash(new_puz_hash, root_hash, launcher_id)
 
         # Construct the current puzzles
-        current_inner_puzzle: Program = self.standard_wallet.puzzle_for_pk(inner_puzzle_derivation.pubkey)
+        # The derivation record was found by this puzzle hash so we don't need to hash the puzzle again
+        current_inner_puzzle: Program = _standard_puzzle_for_pk(inner_puzzle_derivation.pubkey)
+        current_inner_puzzle_hash: bytes32 = singleton_record.inner_puzzle_hash
         current_full_puz = create_host_fullpuz(
             current_inner_puzzle,
             singleton_record.root,
@@ -438,12 +570,13 @@ class DataLayerWallet:
         assert singleton_record.lineage_proof.amount is not None
         current_coin = Coin(
             singleton_record.lineage_proof.parent_name,
-            current_full_puz.get_tree_hash(),
+            _host_fullpuz_hash(current_inner_puzzle_hash, singleton_record.root, launcher_id),
             singleton_record.lineage_proof.amount,
         )
+        current_coin_id: bytes32 = current_coin.name()
 
         new_singleton_record = SingletonRecord(
-            coin_id=Coin(current_coin.name(), next_full_puz_hash, singleton_record.lineage_proof.amount).name(),
+            coin_id=Coin(current_coin_id, next_full_puz_hash, singleton_record.lineage_proof.amount).name(),
             launcher_id=launcher_id,
             root=root_hash,
             inner_puzzle_hash=new_puz_hash,
@@ -474,14 +607,15 @@ class DataLayerWallet:
                     ],
                 )
             )
+            announce_only_hash: bytes32 = announce_only.get_tree_hash()
             second_full_puz: Program = create_host_fullpuz(
                 announce_only,
                 root_hash,
                 launcher_id,
             )
-            second_coin = Coin(
-                current_coin.name(), second_full_puz.get_tree_hash(), singleton_record.lineage_proof.amount
-            )
+            second_full_puz_hash: bytes32 = second_full_puz.get_tree_hash()
+            second_coin = Coin(current_coin_id, second_full_puz_hash, singleton_record.lineage_proof.amount)
+            second_coin_id: bytes32 = second_coin.name()
             second_coin_spend = CoinSpend(
                 second_coin,
                 second_full_puz.to_serialized_program(),
@@ -489,7 +623,7 @@ class DataLayerWallet:
                     [
                         LineageProof(
                             current_coin.parent_coin_info,
-                            create_host_layer_puzzle(current_inner_puzzle, singleton_record.root).get_tree_hash(),
+                            _host_layer_puzzle_hash(current_inner_puzzle_hash, singleton_record.root),
                             singleton_record.lineage_proof.amount,
                         ).to_program(),
                         singleton_record.lineage_proof.amount,
@@ -497,31 +631,31 @@ class DataLayerWallet:
                     ]
                 ),
             )
-            root_announce = Announcement(second_full_puz.get_tree_hash(), b"$")
+            root_announce = Announcement(second_full_puz_hash, b"$")
             if puzzle_announcements_to_consume is None:
-                puzzle_announcements_to_consume = set((root_announce,))
+                puzzle_announcements_to_consume = {root_announce}
             else:
                 puzzle_announcements_to_consume.add(root_announce)
             second_singleton_record = SingletonRecord(
-                coin_id=second_coin.name(),
+                coin_id=second_coin_id,
                 launcher_id=launcher_id,
                 root=root_hash,
-                inner_puzzle_hash=announce_only.get_tree_hash(),
+                inner_puzzle_hash=announce_only_hash,
                 confirmed=False,
                 confirmed_at_height=uint32(0),
                 timestamp=uint64(0),
                 lineage_proof=LineageProof(
                     second_coin.parent_coin_info,
-                    announce_only.get_tree_hash(),
+                    announce_only_hash,
                     singleton_record.lineage_proof.amount,
                 ),
                 generation=uint32(singleton_record.generation + 1),
             )
             new_singleton_record = dataclasses.replace(
                 new_singleton_record,
-                coin_id=Coin(second_coin.name(), next_full_puz_hash, singleton_record.lineage_proof.amount).name(),
+                coin_id=Coin(second_coin_id, next_full_puz_hash, singleton_record.lineage_proof.amount).name(),
                 lineage_proof=LineageProof(
-                    second_coin.name(),
+                    second_coin_id,
                     next_full_puz_hash,
                     singleton_record.lineage_proof.amount,
                 ),
@@ -529,9 +663,15 @@ class DataLayerWallet:
             )
 
         # Create the solution
+        coin_announcement_names: Optional[Set[bytes32]] = (
+            None if coin_announcements_to_consume is None else {a.name() for a in coin_announcements_to_consume}
+        )
+        puzzle_announcement_names: Optional[Set[bytes32]] = (
+            None if puzzle_announcements_to_consume is None else {a.name() for a in puzzle_announcements_to_consume}
+        )
         primaries: List[AmountWithPuzzlehash] = [
             {
-                "puzzlehash": announce_only.get_tree_hash() if announce_new_state else new_puz_hash,
+                "puzzlehash": announce_only_hash if announce_new_state else new_puz_hash,
                 "amount": singleton_record.lineage_proof.amount if new_amount is None else new_amount,
                 "memos": [launcher_id, root_hash, new_puz_hash],
             }
@@ -539,12 +679,8 @@ class DataLayerWallet:
         inner_sol: Program = self.standard_wallet.make_solution(
             primaries=primaries,
             coin_announcements={b"$"} if fee > 0 else None,
-            coin_announcements_to_assert={a.name() for a in coin_announcements_to_consume}
-            if coin_announcements_to_consume is not None
-            else None,
-            puzzle_announcements_to_assert={a.name() for a in puzzle_announcements_to_consume}
-            if puzzle_announcements_to_consume is not None
-            else None,
+            coin_announcements_to_assert=coin_announcement_names,
+            puzzle_announcements_to_assert=puzzle_announcement_names,
         )
         if root_hash != singleton_record.root:
             magic_condition = Program.to([-24, ACS_MU, [[Program.to((root_hash, None)), ACS_MU_PH], None]])
@@ -565,7 +701,7 @@ class DataLayerWallet:
             SerializedProgram.from_program(current_full_puz),
             SerializedProgram.from_program(full_sol),
         )
-        await self.standard_wallet.hack_populate_secret_key_for_puzzle_hash(current_inner_puzzle.get_tree_hash())
+        await self.standard_wallet.hack_populate_secret_key_for_puzzle_hash(current_inner_puzzle_hash)
 
         if sign:
             spend_bundle = await self.sign(coin_spend)
@@ -575,6 +711,7 @@ class DataLayerWallet:
         if announce_new_state:
             spend_bundle = dataclasses.replace(spend_bundle, coin_spends=[coin_spend, second_coin_spend])
 
+        spend_bundle_additions, spend_bundle_memos = compute_additions_and_memos(spend_bundle)
         dl_tx = TransactionRecord(
             confirmed_at_height=uint32(0),
             created_at_time=uint64(int(time.time())),
@@ -584,9 +721,9 @@ class DataLayerWallet:
             confirmed=False,
             sent=uint32(10),
             spend_bundle=spend_bundle,
-            additions=spend_bundle.additions(),
+            additions=spend_bundle_additions,
             removals=spend_bundle.removals(),
-            memos=list(compute_memos(spend_bundle).items()),
+            memos=list(spend_bundle_memos.items()),
             wallet_id=self.id(),
             sent_to=[],
             trade_id=None,
@@ -594,9 +731,7 @@ class DataLayerWallet:
             name=singleton_record.coin_id,
         )
         if fee > 0:
-            lotus_tx = await self.create_tandem_lch_tx(
-                fee, Announcement(current_coin.name(), b"$"), coin_announcement=True
-            )
+            lotus_tx = await self.create_tandem_lch_tx(fee, Announcement(current_coin_id, b"$"), coin_announcement=True)
             aggregate_bundle = SpendBundle.aggregate([dl_tx.spend_bundle, lotus_tx.spend_bundle])
             dl_tx = dataclasses.replace(dl_tx, spend_bundle=aggregate_bundle)
             lotus_tx = dataclasses.replace(lotus_tx, spend_bundle=None)
@@ -620,7 +755,7 @@ class DataLayerWallet:
         amounts: List[uint64],
         puzzle_hashes: List[bytes32],
         fee: uint64 = uint64(0),
-        coins: Set[Coin] = set(),
+        coins: Optional[Set[Coin]] = None,
         memos: Optional[List[List[bytes]]] = None,  # ignored
         coin_announcements_to_consume: Optional[Set[Announcement]] = None,
         puzzle_announcements_to_consume: Optional[Set[Announcement]] = None,
@@ -633,7 +768,7 @@ class DataLayerWallet:
         announce_new_state: bool = False,
     ) -> List[TransactionRecord]:
         # Figure out the launcher ID
-        if len(coins) == 0:
+        if not coins:
             if launcher_id is None:
                 raise ValueError("Not enough info to know which DL coin to send")
         else:
@@ -663,8 +798,19 @@ class DataLayerWallet:
         )
 
     async def get_spendable_singleton_info(self, launcher_id: bytes32) -> Tuple[SingletonRecord, LineageProof]:
-        # First, let's make sure this is a singleton that we track and that we can spend
+        singleton_record: SingletonRecord = await self.get_spendable_singleton_record(launcher_id)
+        parent_lineage: LineageProof = await self.get_parent_lineage(singleton_record)
+        return singleton_record, parent_lineage
+
+    async def get_spendable_singleton_record(self, launcher_id: bytes32) -> SingletonRecord:
         singleton_record: Optional[SingletonRecord] = await self.get_latest_singleton(launcher_id)
+        return self._check_spendable_singleton(launcher_id, singleton_record)
+
+    @staticmethod
+    def _check_spendable_singleton(
+        launcher_id: bytes32, singleton_record: Optional[SingletonRecord]
+    ) -> SingletonRecord:
+        # First, let's make sure this is a singleton that we track and that we can spend
         if singleton_record is None:
             raise ValueError(f"Singleton with launcher ID {launcher_id} is not tracked by DL Wallet")
 
@@ -676,52 +822,63 @@ class DataLayerWallet:
         if singleton_record.lineage_proof.parent_name is None or singleton_record.lineage_proof.amount is None:
             raise ValueError(f"Singleton with launcher ID {launcher_id} has insufficient information to spend")
 
-        # Finally, let's get the parent record for its lineage proof
-        parent_singleton: Optional[SingletonRecord] = await self.wallet_state_manager.dl_store.get_singleton_record(
-            singleton_record.lineage_proof.parent_name
-        )
-        parent_lineage: LineageProof
-        if parent_singleton is None:
-            if singleton_record.lineage_proof.parent_name != launcher_id:
-                raise ValueError(f"Have not found the parent of singleton with launcher ID {launcher_id}")
-            else:
-                launcher_coin: Optional[Coin] = await self.wallet_state_manager.dl_store.get_launcher(launcher_id)
-                if launcher_coin is None:
-                    raise ValueError(f"DL Wallet does not have launcher info for id {launcher_id}")
-                else:
-                    parent_lineage = LineageProof(launcher_coin.parent_coin_info, None, uint64(launcher_coin.amount))
+        return singleton_record
+
+    async def get_parent_lineage(
+        self, singleton_record: SingletonRecord, known_singletons: Optional[Dict[bytes32, SingletonRecord]] = None
+    ) -> LineageProof:
+        """
+        Returns the lineage proof of the singleton's parent. If `known_singletons` is passed, the parent is looked up in
+        it rather than in the DL store.
+        """
+        launcher_id: bytes32 = singleton_record.launcher_id
+        parent_name: Optional[bytes32] = singleton_record.lineage_proof.parent_name
+        assert parent_name is not None
+
+        # The first singleton's parent is the launcher which is never stored as a singleton record
+        if parent_name == launcher_id:
+            launcher_coin: Optional[Coin] = await self.wallet_state_manager.dl_store.get_launcher(launcher_id)
+            if launcher_coin is None:
+                raise ValueError(f"DL Wallet does not have launcher info for id {launcher_id}")
+            return LineageProof(launcher_coin.parent_coin_info, None, uint64(launcher_coin.amount))
+
+        # Otherwise, let's get the parent record for its lineage proof
+        parent_singleton: Optional[SingletonRecord]
+        if known_singletons is not None:
+            parent_singleton = known_singletons.get(parent_name)
         else:
-            parent_lineage = parent_singleton.lineage_proof
+            parent_singleton = await self.wallet_state_manager.dl_store.get_singleton_record(parent_name)
+        if parent_singleton is None:
+            raise ValueError(f"Have not found the parent of singleton with launcher ID {launcher_id}")
 
-        return singleton_record, parent_lineage
+        return parent_singleton.lineage_proof
 
     async def get_owned_singletons(self) -> List[SingletonRecord]:
         launcher_ids = await self.wallet_state_manager.dl_store.get_all_launchers()
 
-        collected = []
-
-        for launcher_id in launcher_ids:
-            singleton_record = await self.wallet_state_manager.dl_store.get_latest_singleton(launcher_id=launcher_id)
-            if singleton_record is None:
-                # this is likely due to a race between getting the list and acquiring the extra data
-                continue
-
-            inner_puzzle_derivation: Optional[
-                DerivationRecord
-            ] = await self.wallet_state_manager.puzzle_store.get_derivation_record_for_puzzle_hash(
-                singleton_record.inner_puzzle_hash
-            )
-            if inner_puzzle_derivation is not None:
-                collected.append(singleton_record)
+        # A launcher may be missing here due to a race between getting the list and acquiring the extra data
+        latest_singletons: Dict[
+            bytes32, SingletonRecord
+        ] = await self.wallet_state_manager.dl_store.get_latest_singletons(launcher_ids)
+        inner_puzzle_derivations: Dict[
+            bytes32, DerivationRecord
+        ] = await self.wallet_state_manager.puzzle_store.get_derivation_records_for_puzzle_hashes(
+            [record.inner_puzzle_hash for record in latest_singletons.values()]
+        )
 
-        return collected
+        return [
+            latest_singletons[launcher_id]
+            for launcher_id in launcher_ids
+            if launcher_id in latest_singletons
+            and latest_singletons[launcher_id].inner_puzzle_hash in inner_puzzle_derivations
+        ]
 
     async def create_new_mirror(
         self, launcher_id: bytes32, amount: uint64, urls: List[bytes], fee: uint64 = uint64(0)
     ) -> List[TransactionRecord]:
         create_mirror_tx_record: Optional[TransactionRecord] = await self.standard_wallet.generate_signed_transaction(
             amount=amount,
-            puzzle_hash=create_mirror_puzzle().get_tree_hash(),
+            puzzle_hash=MIRROR_PUZZLE_HASH,
             fee=fee,
             primaries=[],
             memos=[launcher_id, *(url for url in urls)],
@@ -759,7 +916,7 @@ class DataLayerWallet:
         )
         mirror_spend = CoinSpend(
             mirror_coin,
-            create_mirror_puzzle().to_serialized_program(),
+            MIRROR_PUZZLE_SERIALIZED,
             Program.to(
                 [
                     parent_coin.parent_coin_info,
@@ -770,6 +927,7 @@ class DataLayerWallet:
             ),
         )
         mirror_bundle: SpendBundle = await self.sign(mirror_spend)
+        mirror_bundle_additions, mirror_bundle_memos = compute_additions_and_memos(mirror_bundle)
         txs = [
             TransactionRecord(
                 confirmed_at_height=uint32(0),
@@ -780,9 +938,9 @@ class DataLayerWallet:
                 confirmed=False,
                 sent=uint32(10),
                 spend_bundle=mirror_bundle,
-                additions=mirror_bundle.additions(),
+                additions=mirror_bundle_additions,
                 removals=mirror_bundle.removals(),
-                memos=list(compute_memos(mirror_bundle).items()),
+                memos=list(mirror_bundle_memos.items()),
                 wallet_id=self.id(),  # This is being called before the wallet is created so we're using a temp ID of 0
                 sent_to=[],
                 trade_id=None,
@@ -812,7 +970,7 @@ class DataLayerWallet:
     ###########
 
     async def coin_added(self, coin: Coin, height: uint32, peer: WSLotusConnection) -> None:
-        if coin.puzzle_hash == create_mirror_puzzle().get_tree_hash():
+        if coin.puzzle_hash == MIRROR_PUZZLE_HASH:
             parent_state: CoinState = (
                 await self.wallet_state_manager.wallet_node.get_coin_state([coin.parent_coin_info], peer=peer)
             )[0]
@@ -824,23 +982,24 @@ class DataLayerWallet:
                 parent_spend.puzzle_reveal.to_program(), parent_spend.solution.to_program()
             )
             ours: bool = await self.wallet_state_manager.get_wallet_for_coin(coin.parent_coin_info) is not None
+            coin_id: bytes32 = coin.name()
             await self.wallet_state_manager.dl_store.add_mirror(
                 Mirror(
-                    coin.name(),
+                    coin_id,
                     launcher_id,
                     uint64(coin.amount),
                     urls,
                     ours,
                 )
             )
-            await self.wallet_state_manager.add_interested_coin_ids([coin.name()])
+            await self.wallet_state_manager.add_interested_coin_ids([coin_id])
 
     async def singleton_removed(self, parent_spend: CoinSpend, height: uint32) -> None:
         parent_name = parent_spend.coin.name()
         puzzle = parent_spend.puzzle_reveal
         solution = parent_spend.solution
 
-        matched, _ = match_dl_singleton(puzzle.to_program())
+        matched, _ = _match_dl_singleton(bytes(puzzle))
         if matched:
             self.log.info(f"DL singleton removed: {parent_spend.coin}")
             singleton_record: Optional[SingletonRecord] = await self.wallet_state_manager.dl_store.get_singleton_record(
@@ -859,32 +1018,26 @@ class DataLayerWallet:
             conditions = puzzle.run_with_cost(self.wallet_state_manager.constants.MAX_BLOCK_COST_CLVM, solution)[
                 1
             ].as_python()
-            found_singleton: bool = False
-            for condition in conditions:
-                if condition[0] == ConditionOpcode.CREATE_COIN and int.from_bytes(condition[2], "big") % 2 == 1:
-                    full_puzzle_hash = bytes32(condition[1])
-                    amount = uint64(int.from_bytes(condition[2], "big"))
-                    try:
-                        root = bytes32(condition[3][1])
-                        inner_puzzle_hash = bytes32(condition[3][2])
-                    except IndexError:
-                        self.log.warning(
-                            f"Parent {parent_name} with launcher {singleton_record.launcher_id} "
-                            "did not hint its child properly"
-                        )
-                        return
-                    found_singleton = True
-                    break
-
-            if not found_singleton:
+            odd_child = _find_odd_create_coin(conditions)
+            if odd_child is None:
                 self.log.warning(f"Singleton with launcher ID {singleton_record.launcher_id} was melted")
                 return
+            full_puzzle_hash, amount, memos = odd_child
+            try:
+                root = bytes32(memos[1])
+                inner_puzzle_hash = bytes32(memos[2])
+            except IndexError:
+                self.log.warning(
+                    f"Parent {parent_name} with launcher {singleton_record.launcher_id} "
+                    "did not hint its child properly"
+                )
+                return
 
-            new_singleton = Coin(parent_name, full_puzzle_hash, amount)
             timestamp = await self.wallet_state_manager.wallet_node.get_timestamp_for_height(height)
+            new_singleton_id: bytes32 = Coin(parent_name, full_puzzle_hash, amount).name()
             await self.wallet_state_manager.dl_store.add_singleton_record(
                 SingletonRecord(
-                    coin_id=new_singleton.name(),
+                    coin_id=new_singleton_id,
                     launcher_id=singleton_record.launcher_id,
                     root=root,
                     inner_puzzle_hash=inner_puzzle_hash,
@@ -893,17 +1046,15 @@ class DataLayerWallet:
                     timestamp=timestamp,
                     lineage_proof=LineageProof(
                         parent_name,
-                        create_host_layer_puzzle(inner_puzzle_hash, root).get_tree_hash_precalc(inner_puzzle_hash),
+                        _host_layer_puzzle_hash(inner_puzzle_hash, root),
                         amount,
                     ),
                     generation=uint32(singleton_record.generation + 1),
                 )
             )
-            await self.wallet_state_manager.add_interested_coin_ids(
-                [new_singleton.name()],
-            )
+            await self.wallet_state_manager.add_interested_coin_ids([new_singleton_id])
             await self.potentially_handle_resubmit(singleton_record.launcher_id)
-        elif parent_spend.coin.puzzle_hash == create_mirror_puzzle().get_tree_hash():
+        elif parent_spend.coin.puzzle_hash == MIRROR_PUZZLE_HASH:
             await self.wallet_state_manager.dl_store.delete_mirror(parent_name)
 
     async def potentially_handle_resubmit(self, launcher_id: bytes32) -> None:
@@ -916,12 +1067,17 @@ class DataLayerWallet:
         unconfirmed_singletons = await self.wallet_state_manager.dl_store.get_unconfirmed_singletons(launcher_id)
         if len(unconfirmed_singletons) == 0:
             return
-        unconfirmed_singletons = sorted(unconfirmed_singletons, key=attrgetter("generation"))
         full_branch: List[SingletonRecord] = await self.wallet_state_manager.dl_store.get_all_singletons_for_launcher(
             launcher_id,
             min_generation=unconfirmed_singletons[0].generation,
         )
-        if len(unconfirmed_singletons) == len(full_branch) and set(unconfirmed_singletons) == set(full_branch):
+        # full_branch is ordered newest first so compare the tips before comparing every record.  Coin IDs are the
+        # primary key of the singleton records so comparing them is enough to know the branches are the same records.
+        if (
+            len(unconfirmed_singletons) == len(full_branch)
+            and unconfirmed_singletons[-1].coin_id == full_branch[0].coin_id
+            and sorted(s.coin_id for s in unconfirmed_singletons) == sorted(s.coin_id for s in full_branch)
+        ):
             return
 
         # Now we have detected a fork so we should check whether the root changed at all
@@ -936,15 +1092,13 @@ class DataLayerWallet:
 
         # Regardless of whether the root changed or not, our old state is bad so let's eliminate it
         # First let's find all of our txs matching our unconfirmed singletons
-        relevant_dl_txs: List[TransactionRecord] = []
-        for singleton in unconfirmed_singletons:
-            parent_name = singleton.lineage_proof.parent_name
-            if parent_name is None:
-                continue
-
-            tx = await self.wallet_state_manager.tx_store.get_transaction_record(parent_name)
-            if tx is not None:
-                relevant_dl_txs.append(tx)
+        parent_names: List[bytes32] = [
+            singleton.lineage_proof.parent_name
+            for singleton in unconfirmed_singletons
+            if singleton.lineage_proof.parent_name is not None
+        ]
+        txs_by_name = await self.wallet_state_manager.tx_store.get_transaction_records(parent_names)
+        relevant_dl_txs: List[TransactionRecord] = [txs_by_name[name] for name in parent_names if name in txs_by_name]
         # Let's check our standard wallet for fee transactions related to these dl txs
         all_spends: List[SpendBundle] = [tx.spend_bundle for tx in relevant_dl_txs if tx.spend_bundle is not None]
         all_removal_ids: Set[bytes32] = {removal.name() for sb in all_spends for removal in sb.removals()}
@@ -952,41 +1106,44 @@ class DataLayerWallet:
             TransactionRecord
         ] = await self.wallet_state_manager.tx_store.get_unconfirmed_for_wallet(self.standard_wallet.id())
         relevant_std_txs: List[TransactionRecord] = [
-            tx for tx in unconfirmed_std_txs if any(c.name() in all_removal_ids for c in tx.removals)
+            tx for tx in unconfirmed_std_txs if not all_removal_ids.isdisjoint(c.name() for c in tx.removals)
         ]
-        # Delete all of the relevant transactions
-        for tx in [*relevant_dl_txs, *relevant_std_txs]:
-            await self.wallet_state_manager.tx_store.delete_transaction_record(tx.name)
-        # Delete all of the unconfirmed singleton records
-        for singleton in unconfirmed_singletons:
-            await self.wallet_state_manager.dl_store.delete_singleton_record(singleton.coin_id)
-
-        if not root_changed:
-            # The root never changed so let's attempt a rebase
-            try:
-                all_txs: List[TransactionRecord] = []
-                for singleton in unconfirmed_singletons:
-                    for tx in relevant_dl_txs:
-                        if any(c.name() == singleton.coin_id for c in tx.additions):
-                            if tx.spend_bundle is not None:
-                                fee = uint64(tx.spend_bundle.fees())
-                            else:
-                                fee = uint64(0)
-
-                            all_txs.extend(
-                                await self.create_update_state_spend(
-                                    launcher_id,
-                                    singleton.root,
-                                    fee=fee,
-                                )
-                            )
-                for tx in all_txs:
-                    await self.wallet_state_manager.add_pending_transaction(tx)
-            except Exception as e:
-                self.log.warning(f"Something went wrong during attempted DL resubmit: {str(e)}")
-                # Something went wrong so let's delete anything pending that was created
-                for singleton in unconfirmed_singletons:
-                    await self.wallet_state_manager.dl_store.delete_singleton_record(singleton.coin_id)
+        # Do all of the cleanup and resubmission in a single transaction
+        async with self.wallet_state_manager.db_wrapper.writer():
+            # Delete all of the relevant transactions
+            await self.wallet_state_manager.tx_store.delete_transaction_records(
+                [tx.name for tx in [*relevant_dl_txs, *relevant_std_txs]]
+            )
+            # Delete all of the unconfirmed singleton records
+            await self.wallet_state_manager.dl_store.delete_singleton_records(
+                [singleton.coin_id for singleton in unconfirmed_singletons]
+            )
+
+            if not root_changed:
+                # The root never changed so let's attempt a rebase
+                try:
+                    # If anything goes wrong, rolling back this nested transaction removes anything pending we created
+                    async with self.wallet_state_manager.db_wrapper.writer():
+                        all_txs: List[TransactionRecord] = []
+                        for singleton in unconfirmed_singletons:
+                            for tx in relevant_dl_txs:
+                                if any(c.name() == singleton.coin_id for c in tx.additions):
+                                    if tx.spend_bundle is not None:
+                                        fee = uint64(tx.spend_bundle.fees())
+                                    else:
+                                        fee = uint64(0)
+
+                                    all_txs.extend(
+                                        await self.create_update_state_spend(
+                                            launcher_id,
+                                            singleton.root,
+                                            fee=fee,
+                                        )
+                                    )
+                        for tx in all_txs:
+                            await self.wallet_state_manager.add_pending_transaction(tx)
+                except Exception as e:
+                    self.log.warning(f"Something went wrong during attempted DL resubmit: {str(e)}")
 
     async def stop_tracking_singleton(self, launcher_id: bytes32) -> None:
         await self.wallet_state_manager.dl_store.delete_singleton_records_by_launcher_id(launcher_id)
@@ -1054,7 +1211,7 @@ class DataLayerWallet:
         )
 
     async def get_new_puzzlehash(self) -> bytes32:
-        return (await self.get_new_puzzle()).get_tree_hash()
+        return (await self.wallet_state_manager.get_unused_derivation_record(self.wallet_info.id)).puzzle_hash
 
     async def new_peak(self, peak: BlockRecord) -> None:
         pass
@@ -1094,11 +1251,11 @@ class DataLayerWallet:
             {
                 "type": AssetType.SINGLETON.value,
                 "launcher_id": "0x" + launcher_id.hex(),
-                "launcher_ph": "0x" + SINGLETON_LAUNCHER_HASH.hex(),
+                "launcher_ph": _SINGLETON_LAUNCHER_HASH_INFO,
                 "also": {
                     "type": AssetType.METADATA.value,
                     "metadata": f"(0x{record.root} . ())",
-                    "updater_hash": "0x" + ACS_MU_PH.hex(),
+                    "updater_hash": _ACS_MU_PH_INFO,
                 },
             }
         )
@@ -1107,9 +1264,7 @@ class DataLayerWallet:
         record = await self.get_latest_singleton(launcher_id)
         if record is None:
             raise ValueError(f"DL wallet does not know about launcher ID {launcher_id}")
-        puzhash: bytes32 = create_host_fullpuz(
-            record.inner_puzzle_hash, record.root, launcher_id
-        ).get_tree_hash_precalc(record.inner_puzzle_hash)
+        puzhash: bytes32 = _host_fullpuz_hash(record.inner_puzzle_hash, record.root, launcher_id)
         assert record.lineage_proof.parent_name is not None
         assert record.lineage_proof.amount is not None
         return set([Coin(record.lineage_proof.parent_name, puzhash, record.lineage_proof.amount)])
@@ -1122,11 +1277,7 @@ class DataLayerWallet:
         solver: Solver,
         fee: uint64 = uint64(0),
     ) -> Offer:
-        dl_wallet = None
-        for wallet in wallet_state_manager.wallets.values():
-            if wallet.type() == WalletType.DATA_LAYER.value:
-                dl_wallet = wallet
-                break
+        dl_wallet = wallet_state_manager.get_dl_wallet()
         if dl_wallet is None:
             raise ValueError("DL Wallet is not initialized")
 
@@ -1153,10 +1304,16 @@ class DataLayerWallet:
             fee_left_to_pay = uint64(0)
 
             assert txs[0].spend_bundle is not None
-            dl_spend: CoinSpend = next(
-                cs for cs in txs[0].spend_bundle.coin_spends if match_dl_singleton(cs.puzzle_reveal.to_program())[0]
-            )
-            all_other_spends: List[CoinSpend] = [cs for cs in txs[0].spend_bundle.coin_spends if cs != dl_spend]
+            # Split out the DL spend in one pass, only matching puzzles until we find it
+            maybe_dl_spend: Optional[CoinSpend] = None
+            all_other_spends: List[CoinSpend] = []
+            for cs in txs[0].spend_bundle.coin_spends:
+                if maybe_dl_spend is None and _match_dl_singleton(bytes(cs.puzzle_reveal))[0]:
+                    maybe_dl_spend = cs
+                else:
+                    all_other_spends.append(cs)
+            assert maybe_dl_spend is not None
+            dl_spend: CoinSpend = maybe_dl_spend
             dl_solution: Program = dl_spend.solution.to_program()
             old_graftroot: Program = dl_solution.at("rrffrf")
             new_graftroot: Program = create_graftroot_offer_puz(
@@ -1190,21 +1347,30 @@ class DataLayerWallet:
         # Build a mapping of launcher IDs to their new innerpuz
         singleton_to_innerpuzhash: Dict[bytes32, bytes32] = {}
         innerpuzhash_to_root = {}
-        all_parent_ids: List[bytes32] = [cs.coin.parent_coin_info for cs in offer.bundle.coin_spends]
+        all_parent_ids: Set[bytes32] = {cs.coin.parent_coin_info for cs in offer.bundle.coin_spends}
+        dl_spend_ids: Set[bytes32] = set()
         for spend in offer.bundle.coin_spends:
-            matched, curried_args = match_dl_singleton(spend.puzzle_reveal.to_program())
-            if matched and spend.coin.name() not in all_parent_ids:
+            matched, curried_args = _match_dl_singleton(bytes(spend.puzzle_reveal))
+            if not matched:
+                continue
+            spend_id: bytes32 = spend.coin.name()
+            dl_spend_ids.add(spend_id)
+            if spend_id not in all_parent_ids:
                 innerpuz, temp_root, launcher_id = curried_args
-                innerpuzhash_to_root[innerpuz.get_tree_hash()] = temp_root.as_python()
-                singleton_to_innerpuzhash[
-                    launcher_to_struct(bytes32(launcher_id.as_python())).get_tree_hash()
-                ] = innerpuz.get_tree_hash()
+                innerpuz_hash: bytes32 = innerpuz.get_tree_hash()
+                innerpuzhash_to_root[innerpuz_hash] = temp_root.as_python()
+                singleton_to_innerpuzhash[_launcher_struct_hash(bytes32(launcher_id.as_python()))] = innerpuz_hash
+
+        # Parse each proof once and remember which proof, if any, proves each value so that a value shared between
+        # dependencies is only hashed against the proofs the first time we see it
+        parsed_proofs: Optional[List[Tuple[str, bytes32, Tuple[int, List[bytes32]]]]] = None
+        value_to_proof: Dict[bytes, Optional[Tuple[str, Tuple[int, List[bytes32]]]]] = {}
 
         # Create all of the new solutions
         new_spends: List[CoinSpend] = []
         for spend in offer.bundle.coin_spends:
-            solution = spend.solution.to_program()
-            if match_dl_singleton(spend.puzzle_reveal.to_program())[0]:
+            if spend.coin.name() in dl_spend_ids:
+                solution = spend.solution.to_program()
                 try:
                     graftroot: Program = solution.at("rrffrf")
                 except EvalError:
@@ -1213,22 +1379,38 @@ class DataLayerWallet:
                 mod, curried_args = graftroot.uncurry()
                 if mod == GRAFTROOT_DL_OFFERS:
                     _, singleton_structs, _, values_to_prove = curried_args.as_iter()
+                    if parsed_proofs is None:
+                        parsed_proofs = [
+                            (
+                                proof_of_inclusion[0],
+                                bytes32.from_hexstr(proof_of_inclusion[0]),
+                                (proof_of_inclusion[1], proof_of_inclusion[2]),
+                            )
+                            for proof_of_inclusion in solver["proofs_of_inclusion"]
+                        ]
                     all_proofs = []
                     roots = []
                     for values in values_to_prove.as_python():
                         asserted_root: Optional[str] = None
                         proofs_of_inclusion = []
                         for value in values:
-                            for proof_of_inclusion in solver["proofs_of_inclusion"]:
-                                root: str = proof_of_inclusion[0]
-                                proof: Tuple[int, List[bytes32]] = (proof_of_inclusion[1], proof_of_inclusion[2])
-                                if _simplify_merkle_proof(value, proof) == bytes32.from_hexstr(root):
-                                    proofs_of_inclusion.append(proof)
-                                    if asserted_root is None:
-                                        asserted_root = root
-                                    elif asserted_root != root:
-                                        raise ValueError("Malformed DL offer")
-                                    break
+                            if value not in value_to_proof:
+                                value_to_proof[value] = next(
+                                    (
+                                        (root, proof)
+                                        for root, root_bytes, proof in parsed_proofs
+                                        if _simplify_merkle_proof(value, proof) == root_bytes
+                                    ),
+                                    None,
+                                )
+                            root_and_proof = value_to_proof[value]
+                            if root_and_proof is not None:
+                                root, proof = root_and_proof
+                                proofs_of_inclusion.append(proof)
+                                if asserted_root is None:
+                                    asserted_root = root
+                                elif asserted_root != root:
+                                    raise ValueError("Malformed DL offer")
                         roots.append(asserted_root)
                         all_proofs.append(proofs_of_inclusion)
                     if sum(len(proofs) for proofs in all_proofs) < sum(1 for _ in values_to_prove.as_iter()):
@@ -1259,23 +1441,28 @@ class DataLayerWallet:
     @staticmethod
     async def get_offer_summary(offer: Offer) -> Dict[str, Any]:
         summary: Dict[str, Any] = {"offered": []}
+        dl_curried_args: Dict[bytes32, List[Program]] = {}
+        parent_to_spend: Dict[bytes32, CoinSpend] = {}
         for spend in offer.bundle.coin_spends:
-            solution = spend.solution.to_program()
-            matched, curried_args = match_dl_singleton(spend.puzzle_reveal.to_program())
+            matched, curried_args = _match_dl_singleton(bytes(spend.puzzle_reveal))
             if matched:
+                dl_curried_args[spend.coin.name()] = list(curried_args)
+            parent_to_spend.setdefault(spend.coin.parent_coin_info, spend)
+
+        for spend in offer.bundle.coin_spends:
+            spend_id: bytes32 = spend.coin.name()
+            if spend_id in dl_curried_args:
+                solution = spend.solution.to_program()
                 try:
                     graftroot: Program = solution.at("rrffrf")
                 except EvalError:
                     continue
                 mod, graftroot_curried_args = graftroot.uncurry()
                 if mod == GRAFTROOT_DL_OFFERS:
-                    child_spend: CoinSpend = next(
-                        cs for cs in offer.bundle.coin_spends if cs.coin.parent_coin_info == spend.coin.name()
-                    )
-                    _, child_curried_args = match_dl_singleton(child_spend.puzzle_reveal.to_program())
+                    child_spend: CoinSpend = parent_to_spend[spend_id]
                     singleton_summary = {
-                        "launcher_id": list(curried_args)[2].as_python().hex(),
-                        "new_root": list(child_curried_args)[1].as_python().hex(),
+                        "launcher_id": dl_curried_args[spend_id][2].as_python().hex(),
+                        "new_root": dl_curried_args[child_spend.coin.name()][1].as_python().hex(),
                         "dependencies": [],
                     }
                     _, singleton_structs, _, values_to_prove = graftroot_curried_args.as_iter()
@@ -1,12 +1,13 @@
 import dataclasses
-from typing import List, Optional, Type, TypeVar, Union
+from typing import Dict, List, Optional, Type, TypeVar, Union
 
 from aiosqlite import Row
 
 from lotus.data_layer.data_layer_wallet import Mirror, SingletonRecord
 from lotus.types.blockchain_format.coin import Coin
 from lotus.types.blockchain_format.sized_bytes import bytes32
-from lotus.util.db_wrapper import DBWrapper2
+from lotus.util.chunks import chunks
+from lotus.util.db_wrapper import SQLITE_MAX_VARIABLE_NUMBER, DBWrapper2
 from lotus.util.ints import uint16, uint32, uint64
 from lotus.wallet.lineage_proof import LineageProof
 
@@ -84,6 +85,9 @@ class DataLayerStore:
             await conn.execute("CREATE INDEX IF NOT EXISTS inner_puzzle_hash on singleton_records(inner_puzzle_hash)")
             await conn.execute("CREATE INDEX IF NOT EXISTS confirmed_at_height on singleton_records(root)")
             await conn.execute("CREATE INDEX IF NOT EXISTS generation on singleton_records(generation)")
+            await conn.execute(
+                "CREATE INDEX IF NOT EXISTS launcher_id_generation on singleton_records(launcher_id, generation)"
+            )
 
             await conn.execute(("CREATE TABLE IF NOT EXISTS launchers(id blob PRIMARY KEY, coin blob)"))
 
@@ -164,6 +168,44 @@ class DataLayerStore:
             return _row_to_singleton_record(row)
         return None
 
+    async def get_singleton_records(self, coin_ids: List[bytes32]) -> Dict[bytes32, SingletonRecord]:
+        """
+        Returns the SingletonRecords for all of the passed coin IDs that we know about, keyed by coin ID.
+        """
+        records: Dict[bytes32, SingletonRecord] = {}
+        async with self.db_wrapper.reader_no_transaction() as conn:
+            for coin_ids_chunk in chunks(coin_ids, SQLITE_MAX_VARIABLE_NUMBER):
+                rows = await conn.execute_fetchall(
+                    f'SELECT * from singleton_records WHERE coin_id IN ({",".join(["?"] * len(coin_ids_chunk))})',
+                    tuple(coin_ids_chunk),
+                )
+                for row in rows:
+                    record = _row_to_singleton_record(row)
+                    records[record.coin_id] = record
+
+        return records
+
+    async def get_latest_singletons(self, launcher_ids: List[bytes32]) -> Dict[bytes32, SingletonRecord]:
+        """
+        Returns the most recent SingletonRecord for each of the passed launcher IDs that we know about, keyed by
+        launcher ID.
+        """
+        records: Dict[bytes32, SingletonRecord] = {}
+        async with self.db_wrapper.reader_no_transaction() as conn:
+            for launcher_ids_chunk in chunks(launcher_ids, SQLITE_MAX_VARIABLE_NUMBER):
+                # SQLite fills the bare columns of an aggregate query from the row holding the MAX()
+                rows = await conn.execute_fetchall(
+                    "SELECT *, MAX(generation) from singleton_records "
+                    f'WHERE launcher_id IN ({",".join(["?"] * len(launcher_ids_chunk))}) '
+                    "GROUP BY launcher_id",
+                    tuple(launcher_ids_chunk),
+                )
+                for row in rows:
+                    record = _row_to_singleton_record(row)
+                    records[record.launcher_id] = record
+
+        return records
+
     async def get_latest_singleton(
         self, launcher_id: bytes32, only_confirmed: bool = False
     ) -> Optional[SingletonRecord]:
@@ -193,11 +235,12 @@ class DataLayerStore:
 
     async def get_unconfirmed_singletons(self, launcher_id: bytes32) -> List[SingletonRecord]:
         """
-        Returns all singletons with a specific launcher id that have not yet been marked confirmed
+        Returns all singletons with a specific launcher id that have not yet been marked confirmed, oldest first
         """
         async with self.db_wrapper.reader_no_transaction() as conn:
             cursor = await conn.execute(
-                "SELECT * from singleton_records WHERE launcher_id=? AND confirmed=0", (launcher_id,)
+                "SELECT * from singleton_records WHERE launcher_id=? AND confirmed=0 ORDER BY generation ASC",
+                (launcher_id,),
             )
             rows = await cursor.fetchall()
             await cursor.close()
@@ -236,6 +279,14 @@ class DataLayerStore:
         async with self.db_wrapper.writer_maybe_transaction() as conn:
             await (await conn.execute("DELETE FROM singleton_records WHERE coin_id=?", (coin_id,))).close()
 
+    async def delete_singleton_records(self, coin_ids: List[bytes32]) -> None:
+        async with self.db_wrapper.writer_maybe_transaction() as conn:
+            for coin_ids_chunk in chunks(coin_ids, SQLITE_MAX_VARIABLE_NUMBER):
+                await conn.execute_fetchall(
+                    f'DELETE FROM singleton_records WHERE coin_id IN ({",".join(["?"] * len(coin_ids_chunk))})',
+                    tuple(coin_ids_chunk),
+                )
+
     async def delete_singleton_records_by_launcher_id(self, launcher_id: bytes32) -> None:
         async with self.db_wrapper.writer_maybe_transaction() as conn:
             await (await conn.execute("DELETE FROM singleton_records WHERE launcher_id=?", (launcher_id,))).close()
@@ -261,7 +312,10 @@ class DataLayerStore:
             row = await cursor.fetchone()
             await cursor.close()
         if row is not None:
-            return Coin(bytes32(row[1][0:32]), bytes32(row[1][32:64]), uint64(int.from_bytes(row[1][64:72], "big")))
+            launcher_bytes: bytes = row[1]
+            return Coin(
+                bytes32(launcher_bytes[0:32]), bytes32(launcher_bytes[32:64]), uint64.from_bytes(launcher_bytes[64:72])
+            )
         return None
 
     async def get_all_launchers(self) -> List[bytes32]:
@@ -2221,12 +2221,12 @@ class WalletRpcApi:
                 async with self.service.wallet_state_manager.lock:
                     # TODO: This method should optionally link the singletons with announcements.
                     #       Otherwise spends are vulnerable to signature subtraction.
-                    tx_records: List[TransactionRecord] = []
-                    for launcher, root in request["updates"].items():
-                        records = await wallet.create_update_state_spend(
-                            bytes32.from_hexstr(launcher), bytes32.from_hexstr(root)
-                        )
-                        tx_records.extend(records)
+                    tx_records: List[TransactionRecord] = await wallet.create_update_state_spends(
+                        {
+                            bytes32.from_hexstr(launcher): bytes32.from_hexstr(root)
+                            for launcher, root in request["updates"].items()
+                        }
+                    )
                     # Now that we have all the txs, we need to aggregate them all into just one spend
                     modified_txs: List[TransactionRecord] = []
                     aggregate_spend = SpendBundle([], G2Element())
@@ -1,11 +1,13 @@
+from functools import lru_cache
 from typing import Iterator, List, Tuple, Union
 
-from lotus.types.blockchain_format.program import Program
+from lotus.types.blockchain_format.program import Program, SerializedProgram
 from lotus.types.blockchain_format.sized_bytes import bytes32
 from lotus.types.condition_opcodes import ConditionOpcode
 from lotus.util.ints import uint64
 from lotus.wallet.nft_wallet.nft_puzzles import NFT_STATE_LAYER_MOD, create_nft_layer_puzzle_with_curry_params
 from lotus.wallet.puzzles.load_clvm import load_clvm
+from lotus.wallet.puzzles.singleton_top_layer_v1_1 import SINGLETON_LAUNCHER_HASH
 
 # from lotus.types.condition_opcodes import ConditionOpcode
 # from lotus.wallet.util.merkle_tree import MerkleTree, TreeType
@@ -13,16 +15,16 @@ from lotus.wallet.puzzles.load_clvm import load_clvm
 ACS_MU = Program.to(11)  # returns the third argument a.k.a the full solution
 ACS_MU_PH = ACS_MU.get_tree_hash()
 SINGLETON_TOP_LAYER_MOD = load_clvm("singleton_top_layer_v1_1.clvm")
+SINGLETON_TOP_LAYER_MOD_HASH = SINGLETON_TOP_LAYER_MOD.get_tree_hash()
 SINGLETON_LAUNCHER = load_clvm("singleton_launcher.clvm")
+SINGLETON_LAUNCHER_SERIALIZED = SerializedProgram.from_program(SINGLETON_LAUNCHER)
 GRAFTROOT_DL_OFFERS = load_clvm("graftroot_dl_offers.clvm")
 P2_PARENT = load_clvm("p2_parent.clvm")
 
 
 def create_host_fullpuz(innerpuz: Union[Program, bytes32], current_root: bytes32, genesis_id: bytes32) -> Program:
     db_layer = create_host_layer_puzzle(innerpuz, current_root)
-    mod_hash = SINGLETON_TOP_LAYER_MOD.get_tree_hash()
-    singleton_struct = Program.to((mod_hash, (genesis_id, SINGLETON_LAUNCHER.get_tree_hash())))
-    return SINGLETON_TOP_LAYER_MOD.curry(singleton_struct, db_layer)
+    return SINGLETON_TOP_LAYER_MOD.curry(launcher_to_struct(genesis_id), db_layer)
 
 
 def create_host_layer_puzzle(innerpuz: Union[Program, bytes32], current_root: bytes32) -> Program:
@@ -64,10 +66,10 @@ def launch_solution_to_singleton_info(launch_solution: Program) -> Tuple[bytes32
     return full_puzzle_hash, amount, root, inner_puzzle_hash
 
 
+# The struct only depends on the launcher so it is shared by every puzzle built for the same singleton
+@lru_cache(maxsize=1024)
 def launcher_to_struct(launcher_id: bytes32) -> Program:
-    struct: Program = Program.to(
-        (SINGLETON_TOP_LAYER_MOD.get_tree_hash(), (launcher_id, SINGLETON_LAUNCHER.get_tree_hash()))
-    )
+    struct: Program = Program.to((SINGLETON_TOP_LAYER_MOD_HASH, (launcher_id, SINGLETON_LAUNCHER_HASH)))
     return struct
 
 
@@ -86,12 +88,17 @@ def create_mirror_puzzle() -> Program:
     return P2_PARENT.curry(Program.to(1))
 
 
+MIRROR_PUZZLE = create_mirror_puzzle()
+MIRROR_PUZZLE_HASH = MIRROR_PUZZLE.get_tree_hash()
+MIRROR_PUZZLE_SERIALIZED = MIRROR_PUZZLE.to_serialized_program()
+
+
 def get_mirror_info(parent_puzzle: Program, parent_solution: Program) -> Tuple[bytes32, List[bytes]]:
     conditions = parent_puzzle.run(parent_solution)
     for condition in conditions.as_iter():
         if (
             condition.first().as_python() == ConditionOpcode.CREATE_COIN
-            and condition.at("rf").as_python() == create_mirror_puzzle().get_tree_hash()
+            and condition.at("rf").as_python() == MIRROR_PUZZLE_HASH
         ):
             memos: List[bytes] = condition.at("rrrf").as_python()
             launcher_id = bytes32(memos[0])
@@ -1,4 +1,4 @@
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 from clvm.casts import int_from_bytes
 from lotus.types.blockchain_format.program import INFINITE_COST
@@ -6,23 +6,37 @@ from lotus.types.spend_bundle import SpendBundle
 from lotus.types.blockchain_format.sized_bytes import bytes32
 from lotus.types.blockchain_format.coin import Coin
 from lotus.types.condition_opcodes import ConditionOpcode
+from lotus.util.ints import uint64
 
 
-def compute_memos(bundle: SpendBundle) -> Dict[bytes32, List[bytes]]:
+def compute_additions_and_memos(bundle: SpendBundle) -> Tuple[List[Coin], Dict[bytes32, List[bytes]]]:
     """
-    Retrieves the memos for additions in this spend_bundle, which are formatted as a list in the 3rd parameter of
-    CREATE_COIN. If there are no memos, the addition coin_id is not included. If they are not formatted as a list
-    of bytes, they are not included. This is expensive to call, it should not be used in full node code.
+    Returns the same coins as `bundle.additions()` along with the memos described in `compute_memos`, running each
+    puzzle only once. Like `bundle.additions()`, this raises a ValueError if a CREATE_COIN amount does not fit in a
+    uint64. This is expensive to call, it should not be used in full node code.
     """
+    additions: List[Coin] = []
     memos: Dict[bytes32, List[bytes]] = {}
     for coin_spend in bundle.coin_spends:
+        coin_id = coin_spend.coin.name()
         _, result = coin_spend.puzzle_reveal.run_with_cost(INFINITE_COST, coin_spend.solution)
         for condition in result.as_python():
-            if condition[0] == ConditionOpcode.CREATE_COIN and len(condition) >= 4:
-                # If only 3 elements (opcode + 2 args), there is no memo, this is ph, amount
-                coin_added = Coin(coin_spend.coin.name(), bytes32(condition[1]), int_from_bytes(condition[2]))
-                if type(condition[3]) != list:
-                    # If it's not a list, it's not the correct format
-                    continue
+            if condition[0] != ConditionOpcode.CREATE_COIN:
+                continue
+            coin_added = Coin(coin_id, bytes32(condition[1]), uint64(int_from_bytes(condition[2])))
+            additions.append(coin_added)
+            # If only 3 elements (opcode + 2 args), there is no memo, this is ph, amount
+            # If the memo is not a list, it's not the correct format
+            if len(condition) >= 4 and isinstance(condition[3], list):
                 memos[coin_added.name()] = condition[3]
-    return memos
+    return additions, memos
+
+
+def compute_memos(bundle: SpendBundle) -> Dict[bytes32, List[bytes]]:
+    """
+    Retrieves the memos for additions in this spend_bundle, which are formatted as a list in the 3rd parameter of
+    CREATE_COIN. If there are no memos, the addition coin_id is not included. If they are not formatted as a list
+    of bytes, they are not included. Raises a ValueError if any CREATE_COIN amount does not fit in a uint64, even
+    one without memos. This is expensive to call, it should not be used in full node code.
+    """
+    return compute_additions_and_memos(bundle)[1]
@@ -222,11 +222,8 @@ class Wallet:
         condition_list = []
         if len(primaries) > 0:
             for primary in primaries:
-                if "memos" in primary:
-                    memos: Optional[List[bytes]] = primary["memos"]
-                    if memos is not None and len(memos) == 0:
-                        memos = None
-                else:
+                memos: Optional[List[bytes]] = primary.get("memos")
+                if memos is not None and len(memos) == 0:
                     memos = None
                 condition_list.append(make_create_coin_condition(primary["puzzlehash"], primary["amount"], memos))
         if min_time > 0:
@@ -556,7 +556,7 @@ class WalletNode:
                 await self.wallet_state_manager.blockchain.clean_block_records()
 
                 for wallet_id in removed_wallet_ids:
-                    self.wallet_state_manager.wallets.pop(wallet_id)
+                    self.wallet_state_manager.remove_wallet(wallet_id)
 
         # this has to be called *after* the transaction commits, otherwise it
         # won't see the changes (since we spawn a new task to handle potential
@@ -5,7 +5,8 @@ from typing import Dict, List, Optional, Set, Tuple
 from blspy import G1Element
 
 from lotus.types.blockchain_format.sized_bytes import bytes32
-from lotus.util.db_wrapper import DBWrapper2, execute_fetchone
+from lotus.util.chunks import chunks
+from lotus.util.db_wrapper import SQLITE_MAX_VARIABLE_NUMBER, DBWrapper2, execute_fetchone
 from lotus.util.ints import uint32
 from lotus.util.lru_cache import LRUCache
 from lotus.wallet.derivation_record import DerivationRecord
@@ -149,6 +150,26 @@ class WalletPuzzleStore:
 
         return None
 
+    async def get_derivation_records_for_puzzle_hashes(
+        self, puzzle_hashes: List[bytes32]
+    ) -> Dict[bytes32, DerivationRecord]:
+        """
+        Returns the derivation records for all of the passed puzzle hashes that we know about, keyed by puzzle hash.
+        """
+        records: Dict[bytes32, DerivationRecord] = {}
+        async with self.db_wrapper.reader_no_transaction() as conn:
+            for puzzle_hashes_chunk in chunks(puzzle_hashes, SQLITE_MAX_VARIABLE_NUMBER):
+                rows = await conn.execute_fetchall(
+                    "SELECT derivation_index, pubkey, puzzle_hash, wallet_type, wallet_id, hardened "
+                    f'FROM derivation_paths WHERE puzzle_hash IN ({",".join(["?"] * len(puzzle_hashes_chunk))})',
+                    tuple(puzzle_hash.hex() for puzzle_hash in puzzle_hashes_chunk),
+                )
+                for row in rows:
+                    record = self.row_to_record(row)
+                    records[record.puzzle_hash] = record
+
+        return records
+
     async def set_used_up_to(self, index: uint32) -> None:
         """
         Sets a derivation path to used so we don't use it again.
@@ -112,6 +112,7 @@ class WalletStateManager:
 
     main_wallet: Wallet
     wallets: Dict[uint32, Any]
+    wallets_by_type: Dict[WalletType, Dict[uint32, Any]]
     private_key: PrivateKey
 
     trade_manager: TradeManager
@@ -153,6 +154,7 @@ class WalletStateManager:
         self.log.debug(f"Starting in db path: {db_path}")
         db_connection = await aiosqlite.connect(db_path)
         await (await db_connection.execute("pragma journal_mode=wal")).close()
+        await (await db_connection.execute("pragma temp_store=memory")).close()
 
         await (
             await db_connection.execute(
@@ -177,6 +179,7 @@ class WalletStateManager:
         # add reader threads for the DB
         for i in range(self.config.get("db_readers", 4)):
             c = await aiosqlite.connect(db_path)
+            await (await c.execute("pragma temp_store=memory")).close()
             if self.config.get("log_sqlite_cmds", False):
                 await c.set_trace_callback(sql_trace_callback)
             await self.db_wrapper.add_connection(c)
@@ -212,7 +215,9 @@ class WalletStateManager:
         self.private_key = private_key
         self.main_wallet = await Wallet.create(self, main_wallet_info)
 
-        self.wallets = {main_wallet_info.id: self.main_wallet}
+        self.wallets = {}
+        self.wallets_by_type = {}
+        self._register_wallet(self.main_wallet, main_wallet_info.id)
 
         self.asset_to_wallet_map = {
             AssetType.CAT: CATWallet,
@@ -257,7 +262,7 @@ class WalletStateManager:
                     wallet_info,
                 )
             if wallet is not None:
-                self.wallets[wallet_info.id] = wallet
+                self._register_wallet(wallet, wallet_info.id)
 
         return self
 
@@ -1529,8 +1534,16 @@ class WalletStateManager:
                 name,
             )
 
-    async def add_new_wallet(self, wallet: Any, wallet_id: int, create_puzzle_hashes=True):
+    def _register_wallet(self, wallet: Any, wallet_id: int) -> None:
         self.wallets[uint32(wallet_id)] = wallet
+        self.wallets_by_type.setdefault(WalletType(wallet.type()), {})[uint32(wallet_id)] = wallet
+
+    def remove_wallet(self, wallet_id: uint32) -> None:
+        wallet = self.wallets.pop(wallet_id)
+        self.wallets_by_type[WalletType(wallet.type())].pop(wallet_id, None)
+
+    async def add_new_wallet(self, wallet: Any, wallet_id: int, create_puzzle_hashes=True):
+        self._register_wallet(wallet, wallet_id)
         if create_puzzle_hashes:
             await self.create_more_puzzle_hashes()
         self.state_changed("wallet_created")
@@ -1584,6 +1597,16 @@ class WalletStateManager:
         if len(coin_ids) > 0:
             await self.wallet_node.new_peak_queue.subscribe_to_coin_ids(coin_ids)
 
+    async def add_interested(
+        self, puzzle_hashes: List[bytes32], wallet_ids: List[int], coin_ids: List[bytes32]
+    ) -> None:
+        """
+        Same as calling `add_interested_puzzle_hashes` and `add_interested_coin_ids` but writes both in one transaction
+        """
+        async with self.db_wrapper.writer():
+            await self.add_interested_puzzle_hashes(puzzle_hashes, wallet_ids)
+            await self.add_interested_coin_ids(coin_ids)
+
     async def delete_trade_transactions(self, trade_id: bytes32):
         txs: List[TransactionRecord] = await self.tx_store.get_transactions_by_trade_id(trade_id)
         for tx in txs:
@@ -1597,8 +1620,7 @@ class WalletStateManager:
 
         return puzzle_hash
 
-    def get_dl_wallet(self):
-        for _, wallet in self.wallets.items():
-            if wallet.type() == WalletType.DATA_LAYER.value:
-                return wallet
-        return None
+    def get_dl_wallet(self) -> Optional[DataLayerWallet]:
+        wallet = next(iter(self.wallets_by_type.get(WalletType.DATA_LAYER, {}).values()), None)
+        assert wallet is None or isinstance(wallet, DataLayerWallet)
+        return wallet
@@ -4,7 +4,8 @@ from typing import Dict, List, Optional, Tuple
 
 from lotus.types.blockchain_format.sized_bytes import bytes32
 from lotus.types.mempool_inclusion_status import MempoolInclusionStatus
-from lotus.util.db_wrapper import DBWrapper2
+from lotus.util.chunks import chunks
+from lotus.util.db_wrapper import SQLITE_MAX_VARIABLE_NUMBER, DBWrapper2
 from lotus.util.errors import Err
 from lotus.util.ints import uint8, uint32
 from lotus.wallet.transaction_record import TransactionRecord
@@ -106,6 +107,14 @@ class WalletTransactionStore:
         async with self.db_wrapper.writer_maybe_transaction() as conn:
             await (await conn.execute("DELETE FROM transaction_record WHERE bundle_id=?", (tx_id,))).close()
 
+    async def delete_transaction_records(self, tx_ids: List[bytes32]) -> None:
+        async with self.db_wrapper.writer_maybe_transaction() as conn:
+            for tx_ids_chunk in chunks(tx_ids, SQLITE_MAX_VARIABLE_NUMBER):
+                await conn.execute_fetchall(
+                    f'DELETE FROM transaction_record WHERE bundle_id IN ({",".join(["?"] * len(tx_ids_chunk))})',
+                    tuple(tx_ids_chunk),
+                )
+
     async def set_confirmed(self, tx_id: bytes32, height: uint32):
         """
         Updates transaction to be confirmed.
@@ -177,6 +186,22 @@ class WalletTransactionStore:
             return TransactionRecord.from_bytes(rows[0][0])
         return None
 
+    async def get_transaction_records(self, tx_ids: List[bytes32]) -> Dict[bytes32, TransactionRecord]:
+        """
+        Returns the TransactionRecords that exist for the given ids, keyed by id.
+        """
+        records: Dict[bytes32, TransactionRecord] = {}
+        async with self.db_wrapper.reader_no_transaction() as conn:
+            for tx_ids_chunk in chunks(tx_ids, SQLITE_MAX_VARIABLE_NUMBER):
+                rows = await conn.execute_fetchall(
+                    "SELECT bundle_id, transaction_record from transaction_record "
+                    f'WHERE bundle_id IN ({",".join(["?"] * len(tx_ids_chunk))})',
+                    tuple(tx_ids_chunk),
+                )
+                for row in rows:
+                    records[bytes32(row[0])] = TransactionRecord.from_bytes(row[1])
+        return records
+
     # TODO: This should probably be split into separate function, one that
     # queries the state and one that updates it. Also, include_accepted_txs=True
     # might be a separate function too.
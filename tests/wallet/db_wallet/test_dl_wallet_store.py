@@ -0,0 +1,107 @@
+from secrets import token_bytes
+
+import pytest
+
+from lotus.data_layer.data_layer_wallet import SingletonRecord
+from lotus.data_layer.dl_wallet_store import DataLayerStore
+from lotus.types.blockchain_format.sized_bytes import bytes32
+from lotus.util.ints import uint32, uint64
+from lotus.wallet.lineage_proof import LineageProof
+from tests.util.db_connection import DBConnection
+
+
+def make_singleton_record(launcher_id: bytes32, generation: int, confirmed: bool = True) -> SingletonRecord:
+    return SingletonRecord(
+        coin_id=bytes32(token_bytes(32)),
+        launcher_id=launcher_id,
+        root=bytes32(token_bytes(32)),
+        inner_puzzle_hash=bytes32(token_bytes(32)),
+        confirmed=confirmed,
+        confirmed_at_height=uint32(generation if confirmed else 0),
+        lineage_proof=LineageProof(bytes32(token_bytes(32)), bytes32(token_bytes(32)), uint64(1)),
+        generation=uint32(generation),
+        timestamp=uint64(1000 + generation),
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_singleton_records() -> None:
+    async with DBConnection(1) as db_wrapper:
+        store = await DataLayerStore.create(db_wrapper)
+
+        launcher_id = bytes32(token_bytes(32))
+        records = [make_singleton_record(launcher_id, generation) for generation in range(3)]
+        for record in records:
+            await store.add_singleton_record(record)
+
+        missing = bytes32(token_bytes(32))
+        assert await store.get_singleton_records([records[0].coin_id, records[2].coin_id, missing]) == {
+            records[0].coin_id: records[0],
+            records[2].coin_id: records[2],
+        }
+        assert await store.get_singleton_records([]) == {}
+
+
+@pytest.mark.asyncio
+async def test_get_latest_singletons() -> None:
+    async with DBConnection(1) as db_wrapper:
+        store = await DataLayerStore.create(db_wrapper)
+
+        launcher_1 = bytes32(token_bytes(32))
+        launcher_2 = bytes32(token_bytes(32))
+        # Insert out of generation order so the result can't depend on insertion order
+        records_1 = [make_singleton_record(launcher_1, generation) for generation in (1, 3, 0, 2)]
+        records_2 = [
+            make_singleton_record(launcher_2, 0),
+            make_singleton_record(launcher_2, 1, confirmed=False),
+        ]
+        for record in [*records_1, *records_2]:
+            await store.add_singleton_record(record)
+
+        missing = bytes32(token_bytes(32))
+        latest = await store.get_latest_singletons([launcher_1, launcher_2, missing])
+        assert latest == {launcher_1: records_1[1], launcher_2: records_2[1]}
+        for launcher_id, record in latest.items():
+            assert record == await store.get_latest_singleton(launcher_id)
+
+        assert await store.get_latest_singletons([]) == {}
+
+
+@pytest.mark.asyncio
+async def test_delete_singleton_records() -> None:
+    async with DBConnection(1) as db_wrapper:
+        store = await DataLayerStore.create(db_wrapper)
+
+        launcher_id = bytes32(token_bytes(32))
+        records = [make_singleton_record(launcher_id, generation) for generation in range(3)]
+        for record in records:
+            await store.add_singleton_record(record)
+
+        await store.delete_singleton_records([records[0].coin_id, records[2].coin_id, bytes32(token_bytes(32))])
+        assert await store.get_singleton_record(records[0].coin_id) is None
+        assert await store.get_singleton_record(records[1].coin_id) == records[1]
+        assert await store.get_singleton_record(records[2].coin_id) is None
+
+        await store.delete_singleton_records([])
+        assert await store.get_all_singletons_for_launcher(launcher_id) == [records[1]]
+
+
+@pytest.mark.asyncio
+async def test_get_unconfirmed_singletons() -> None:
+    async with DBConnection(1) as db_wrapper:
+        store = await DataLayerStore.create(db_wrapper)
+
+        launcher_id = bytes32(token_bytes(32))
+        other_launcher_id = bytes32(token_bytes(32))
+        confirmed = make_singleton_record(launcher_id, 0)
+        # Insert out of generation order so the result can't depend on insertion order
+        unconfirmed = {
+            generation: make_singleton_record(launcher_id, generation, confirmed=False) for generation in (3, 1, 4, 2)
+        }
+        for record in [confirmed, *unconfirmed.values(), make_singleton_record(other_launcher_id, 1, confirmed=False)]:
+            await store.add_singleton_record(record)
+
+        assert await store.get_unconfirmed_singletons(launcher_id) == [
+            unconfirmed[generation] for generation in sorted(unconfirmed)
+        ]
+        assert await store.get_unconfirmed_singletons(bytes32(token_bytes(32))) == []
@@ -0,0 +1,88 @@
+from typing import Any, List
+
+import pytest
+from blspy import G2Element
+
+from lotus.types.blockchain_format.coin import Coin
+from lotus.types.blockchain_format.program import Program
+from lotus.types.blockchain_format.sized_bytes import bytes32
+from lotus.types.coin_spend import CoinSpend
+from lotus.types.condition_opcodes import ConditionOpcode
+from lotus.types.spend_bundle import SpendBundle
+from lotus.util.ints import uint64
+from lotus.wallet.util.compute_memos import compute_additions_and_memos, compute_memos
+
+# Returns its solution, so the solution is the list of conditions
+ACS = Program.to(1)
+ACS_PH = ACS.get_tree_hash()
+
+
+def spend_with_conditions(parent: bytes32, conditions: List[List[Any]]) -> CoinSpend:
+    return CoinSpend(
+        Coin(parent, ACS_PH, uint64(1000)),
+        ACS,
+        Program.to(conditions),
+    )
+
+
+def test_compute_additions_and_memos() -> None:
+    ph_1 = bytes32([1] * 32)
+    ph_2 = bytes32([2] * 32)
+    ph_3 = bytes32([3] * 32)
+    bundle = SpendBundle(
+        [
+            spend_with_conditions(
+                bytes32([4] * 32),
+                [
+                    [ConditionOpcode.CREATE_COIN, ph_1, 1, [b"memo one", b"memo two"]],
+                    [ConditionOpcode.RESERVE_FEE, 10],
+                    [ConditionOpcode.CREATE_COIN, ph_2, 2],
+                ],
+            ),
+            spend_with_conditions(
+                bytes32([5] * 32),
+                [
+                    # A memo which is not a list is not included
+                    [ConditionOpcode.CREATE_COIN, ph_3, 3, b"not a list"],
+                    [ConditionOpcode.CREATE_COIN, ph_1, 4, [ph_2]],
+                ],
+            ),
+        ],
+        G2Element(),
+    )
+
+    additions, memos = compute_additions_and_memos(bundle)
+    assert additions == bundle.additions()
+    assert memos == compute_memos(bundle)
+    assert memos == {
+        additions[0].name(): [b"memo one", b"memo two"],
+        additions[3].name(): [ph_2],
+    }
+
+
+def test_compute_additions_and_memos_no_spends() -> None:
+    assert compute_additions_and_memos(SpendBundle([], G2Element())) == ([], {})
+
+
+@pytest.mark.parametrize("amount", [-1, 2 ** 64])
+def test_compute_memos_malformed_amount(amount: int) -> None:
+    bundle = SpendBundle(
+        [
+            spend_with_conditions(
+                bytes32([4] * 32),
+                [
+                    [ConditionOpcode.CREATE_COIN, bytes32([1] * 32), 1, [b"memo"]],
+                    # Even a coin without memos must have a valid amount
+                    [ConditionOpcode.CREATE_COIN, bytes32([2] * 32), amount],
+                ],
+            ),
+        ],
+        G2Element(),
+    )
+
+    with pytest.raises(ValueError, match="does not fit into uint64"):
+        bundle.additions()
+    with pytest.raises(ValueError, match="does not fit into uint64"):
+        compute_additions_and_memos(bundle)
+    with pytest.raises(ValueError, match="does not fit into uint64"):
+        compute_memos(bundle)
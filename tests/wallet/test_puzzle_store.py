@@ -3,6 +3,7 @@ from secrets import token_bytes
 import pytest
 from blspy import AugSchemeMPL
 
+from lotus.types.blockchain_format.sized_bytes import bytes32
 from lotus.util.ints import uint32
 from lotus.wallet.derivation_record import DerivationRecord
 from lotus.wallet.util.wallet_types import WalletType
@@ -65,6 +66,12 @@ class TestPuzzleStore:
             assert await db.get_last_derivation_path() == 999
             assert await db.get_unused_derivation_path() == 0
             assert await db.get_derivation_record(0, 2, False) == derivation_recs[1]
+            assert await db.get_derivation_records_for_puzzle_hashes(
+                [derivation_recs[0].puzzle_hash, derivation_recs[3].puzzle_hash, bytes32(token_bytes(32))]
+            ) == {
+                derivation_recs[0].puzzle_hash: derivation_recs[0],
+                derivation_recs[3].puzzle_hash: derivation_recs[3],
+            }
 
             # Indeces up to 250
             await db.set_used_up_to(249)
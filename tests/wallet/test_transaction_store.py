@@ -59,6 +59,36 @@ async def test_delete() -> None:
         assert await store.get_transaction_record(tr1.name) is None
 
 
+@pytest.mark.asyncio
+async def test_delete_many() -> None:
+    async with DBConnection(1) as db_wrapper:
+        store = await WalletTransactionStore.create(db_wrapper)
+
+        tr2 = dataclasses.replace(tr1, name=token_bytes(32))
+        tr3 = dataclasses.replace(tr1, name=token_bytes(32))
+        for tr in [tr1, tr2, tr3]:
+            await store.add_transaction_record(tr)
+
+        await store.delete_transaction_records([tr1.name, tr3.name])
+        assert await store.get_transaction_record(tr1.name) is None
+        assert await store.get_transaction_record(tr2.name) == tr2
+        assert await store.get_transaction_record(tr3.name) is None
+
+
+@pytest.mark.asyncio
+async def test_get_many() -> None:
+    async with DBConnection(1) as db_wrapper:
+        store = await WalletTransactionStore.create(db_wrapper)
+
+        tr2 = dataclasses.replace(tr1, name=token_bytes(32))
+        for tr in [tr1, tr2]:
+            await store.add_transaction_record(tr)
+
+        missing = bytes32(token_bytes(32))
+        assert await store.get_transaction_records([tr1.name, tr2.name, missing]) == {tr1.name: tr1, tr2.name: tr2}
+        assert await store.get_transaction_records([]) == {}
+
+
 @pytest.mark.asyncio
 async def test_set_confirmed() -> None:
     async with DBConnection(1) as db_wrapper:
@@ -0,0 +1,62 @@
+from typing import Any, Dict
+
+from lotus.data_layer.data_layer_wallet import DataLayerWallet
+from lotus.util.ints import uint32
+from lotus.wallet.cat_wallet.cat_wallet import CATWallet
+from lotus.wallet.util.wallet_types import WalletType
+from lotus.wallet.wallet import Wallet
+from lotus.wallet.wallet_state_manager import WalletStateManager
+
+
+def make_wallet_state_manager() -> WalletStateManager:
+    # Only the wallet maps are needed, so skip the databases and stores that create() sets up
+    wallet_state_manager = WalletStateManager()
+    wallet_state_manager.wallets = {}
+    wallet_state_manager.wallets_by_type = {}
+    return wallet_state_manager
+
+
+def assert_index_consistent(wallet_state_manager: WalletStateManager) -> None:
+    expected: Dict[WalletType, Dict[uint32, Any]] = {}
+    for wallet_id, wallet in wallet_state_manager.wallets.items():
+        expected.setdefault(WalletType(wallet.type()), {})[wallet_id] = wallet
+    # Removing the last wallet of a type may leave an empty map behind
+    indexed = {wallet_type: wallets for wallet_type, wallets in wallet_state_manager.wallets_by_type.items() if wallets}
+    assert indexed == expected
+
+
+def test_register_and_remove_wallets() -> None:
+    wallet_state_manager = make_wallet_state_manager()
+    main_wallet = Wallet()
+    cat_wallet_1 = CATWallet()
+    cat_wallet_2 = CATWallet()
+    dl_wallet = DataLayerWallet()
+
+    wallet_state_manager._register_wallet(main_wallet, 1)
+    wallet_state_manager._register_wallet(cat_wallet_1, 2)
+    wallet_state_manager._register_wallet(cat_wallet_2, 3)
+    wallet_state_manager._register_wallet(dl_wallet, 4)
+    assert_index_consistent(wallet_state_manager)
+    assert wallet_state_manager.wallets_by_type[WalletType.CAT] == {uint32(2): cat_wallet_1, uint32(3): cat_wallet_2}
+    assert wallet_state_manager.get_dl_wallet() is dl_wallet
+
+    wallet_state_manager.remove_wallet(uint32(2))
+    assert_index_consistent(wallet_state_manager)
+    assert wallet_state_manager.wallets_by_type[WalletType.CAT] == {uint32(3): cat_wallet_2}
+
+    wallet_state_manager.remove_wallet(uint32(4))
+    assert_index_consistent(wallet_state_manager)
+    assert wallet_state_manager.get_dl_wallet() is None
+
+    # A wallet ID may be registered again after its wallet was removed
+    new_dl_wallet = DataLayerWallet()
+    wallet_state_manager._register_wallet(new_dl_wallet, 4)
+    assert_index_consistent(wallet_state_manager)
+    assert wallet_state_manager.get_dl_wallet() is new_dl_wallet
+
+
+def test_get_dl_wallet_without_dl_wallet() -> None:
+    wallet_state_manager = make_wallet_state_manager()
+    assert wallet_state_manager.get_dl_wallet() is None
+    wallet_state_manager._register_wallet(Wallet(), 1)
+    assert wallet_state_manager.get_dl_wallet() is None